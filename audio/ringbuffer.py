@@ -6,26 +6,73 @@ import numpy as np
 class FloatRingBuffer:
     def __init__(self, max_samples: int):
         self._max_samples = max(1, int(max_samples))
-        self._data = np.empty((0,), dtype=np.float32)
+        self._buf = np.empty((self._max_samples,), dtype=np.float32)
+        self._write = 0
+        self._filled = 0
+        self._scratch = np.empty((0,), dtype=np.float32)
+        self._staged = False
 
     @property
     def size(self) -> int:
-        return int(self._data.size)
+        return self._filled
 
     def clear(self) -> None:
-        self._data = np.empty((0,), dtype=np.float32)
+        self._write = 0
+        self._filled = 0
 
     def append(self, samples: np.ndarray) -> None:
         if samples.size == 0:
             return
-        samples = samples.astype(np.float32, copy=False)
-        self._data = np.concatenate((self._data, samples))
-        if self._data.size > self._max_samples:
-            self._data = self._data[-self._max_samples:]
+        if samples.dtype != np.float32:
+            samples = samples.astype(np.float32)
+        n = samples.size
+        if n >= self._max_samples:
+            np.copyto(self._buf, samples[-self._max_samples:])
+            self._write = 0
+            self._filled = self._max_samples
+            return
+
+        end = self._write + n
+        if end <= self._max_samples:
+            np.copyto(self._buf[self._write:end], samples)
+        else:
+            split = self._max_samples - self._write
+            np.copyto(self._buf[self._write:], samples[:split])
+            np.copyto(self._buf[:n - split], samples[split:])
+        self._write = end % self._max_samples
+        self._filled = min(self._filled + n, self._max_samples)
+
+    def reserve(self, count: int) -> np.ndarray:
+        """
+        Return a writable region for the next `count` samples; fill it and
+        then call commit(). The region is the ring storage itself unless the
+        write would wrap, in which case a reused scratch array is staged.
+        """
+        count = max(0, int(count))
+        if self._write + count <= self._max_samples:
+            self._staged = False
+            return self._buf[self._write:self._write + count]
+        if self._scratch.size < count:
+            self._scratch = np.empty((count,), dtype=np.float32)
+        self._staged = True
+        return self._scratch[:count]
+
+    def commit(self, count: int) -> None:
+        count = int(count)
+        if count <= 0:
+            return
+        if self._staged:
+            self._staged = False
+            self.append(self._scratch[:count])
+            return
+        self._write = (self._write + count) % self._max_samples
+        self._filled = min(self._filled + count, self._max_samples)
 
     def get_last(self, count: int) -> np.ndarray:
-        if self._data.size == 0:
+        k = min(int(count), self._filled)
+        if k <= 0:
             return np.empty((0,), dtype=np.float32)
-        if self._data.size <= count:
-            return self._data.copy()
-        return self._data[-count:].copy()
+        start = (self._write - k) % self._max_samples
+        if start + k <= self._max_samples:
+            return self._buf[start:start + k].copy()
+        return np.concatenate((self._buf[start:], self._buf[:self._write]))
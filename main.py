@@ -26,9 +26,11 @@ def build_parser() -> argparse.ArgumentParser:
 
     parser.add_argument("--whisper-model", default="tiny")
     parser.add_argument("--whisper-device", default="cuda")
-    parser.add_argument("--whisper-compute-type", default="int8")
+    # Defaults to int8_float16 on CUDA (Orin tensor cores) and int8 on CPU.
+    parser.add_argument("--whisper-compute-type", default=None)
     parser.add_argument("--whisper-language", default=None)
     parser.add_argument("--whisper-no-speech-threshold", type=float, default=0.3)
+    parser.add_argument("--whisper-silence-rms", type=float, default=0.005)
 
     parser.add_argument("--opus-en-fr", default="/home/eric/models/opus/ct2/en-fr")
     parser.add_argument("--opus-fr-en", default="/home/eric/models/opus/ct2/fr-en")
@@ -49,8 +51,14 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+def default_whisper_compute_type(device: str) -> str:
+    return "int8_float16" if device.startswith("cuda") else "int8"
+
+
 def main() -> None:
     args = build_parser().parse_args()
+    if args.whisper_compute_type is None:
+        args.whisper_compute_type = default_whisper_compute_type(args.whisper_device)
     logging.basicConfig(
         level=getattr(logging, args.log_level.upper(), logging.INFO),
         format="[%(asctime)s] %(levelname)s %(message)s",
@@ -63,6 +71,7 @@ def main() -> None:
         compute_type=args.whisper_compute_type,
         language=args.whisper_language,
         no_speech_threshold=args.whisper_no_speech_threshold,
+        silence_rms=args.whisper_silence_rms,
     )
     opus = OpusMTConfig(
         en_fr_path=args.opus_en_fr,
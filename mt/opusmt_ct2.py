@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 import logging
+from typing import List, Tuple
 
 import ctranslate2
 from transformers import AutoTokenizer
@@ -18,8 +20,15 @@ class OpusMTConfig:
     lang2_label: str = "fr"
     device: str = "cuda"
     compute_type: str = "float16"
+    # en_fr and fr_en are separate Translators that each decode one batch at
+    # a time, so a second worker per translator would sit idle.
     inter_threads: int = 1
     intra_threads: int = 0
+    beam_size: int = 1
+    max_decoding_ratio: float = 2.0
+    max_decoding_length_floor: int = 8
+    disable_unk: bool = True
+    tokenizer_cache_size: int = 512
 
 
 class _CT2Model:
@@ -37,27 +46,75 @@ class _CT2Model:
             inter_threads=config.inter_threads,
             intra_threads=config.intra_threads,
         )
+        self.config = config
         if config.tokenizer_local_only:
             logging.info("Loading OpusMT tokenizer (offline) from %s", tokenizer_path)
         else:
             logging.info("Loading OpusMT tokenizer from %s", tokenizer_path)
-        self.tokenizer = AutoTokenizer.from_pretrained(
-            tokenizer_path,
-            use_fast=False,
-            local_files_only=config.tokenizer_local_only,
-        )
+        # Prefer the Rust tokenizer; AutoTokenizer already returns the slow
+        # one when no fast variant exists, but conversion can still fail.
+        try:
+            self.tokenizer = AutoTokenizer.from_pretrained(
+                tokenizer_path,
+                use_fast=True,
+                local_files_only=config.tokenizer_local_only,
+            )
+        except ValueError:
+            logging.warning("Fast tokenizer unavailable for %s; using slow tokenizer", tokenizer_path)
+            self.tokenizer = AutoTokenizer.from_pretrained(
+                tokenizer_path,
+                use_fast=False,
+                local_files_only=config.tokenizer_local_only,
+            )
+        # Successive commit deltas often repeat, so memoize the
+        # tokenizer round-trips on the exact text / token sequence.
+        self._encode = lru_cache(maxsize=config.tokenizer_cache_size)(self._encode_uncached)
+        self._decode = lru_cache(maxsize=config.tokenizer_cache_size)(self._decode_uncached)
 
-    def translate(self, text: str) -> str:
-        text = text.strip()
-        if not text:
-            return ""
+    def _encode_uncached(self, text: str) -> Tuple[str, ...]:
         token_ids = self.tokenizer.encode(text)
-        tokens = self.tokenizer.convert_ids_to_tokens(token_ids)
-        result = self.translator.translate_batch([tokens])[0]
-        output_tokens = result.hypotheses[0]
-        output_ids = self.tokenizer.convert_tokens_to_ids(output_tokens)
+        return tuple(self.tokenizer.convert_ids_to_tokens(token_ids))
+
+    def _decode_uncached(self, tokens: Tuple[str, ...]) -> str:
+        output_ids = self.tokenizer.convert_tokens_to_ids(list(tokens))
         return self.tokenizer.decode(output_ids, skip_special_tokens=True)
 
+    def translate(self, text: str) -> str:
+        return self.translate_many([text])[0]
+
+    def translate_many(self, texts: List[str]) -> List[str]:
+        """
+        Translate several texts with a single batched decoder call.
+        Blank entries map to "" so outputs stay aligned with inputs.
+        """
+        outputs = [""] * len(texts)
+        indices: List[int] = []
+        batch: List[List[str]] = []
+        for i, text in enumerate(texts):
+            text = text.strip()
+            if not text:
+                continue
+            indices.append(i)
+            batch.append(list(self._encode(text)))
+        if not batch:
+            return outputs
+
+        # Live-caption deltas are short; greedy decoding with an output cap
+        # proportional to the longest input avoids paying for beam search.
+        longest = max(len(tokens) for tokens in batch)
+        max_len = max(self.config.max_decoding_length_floor, int(self.config.max_decoding_ratio * longest))
+        results = self.translator.translate_batch(
+            batch,
+            max_batch_size=len(batch),
+            beam_size=self.config.beam_size,
+            max_decoding_length=max_len,
+            disable_unk=self.config.disable_unk,
+            return_scores=False,
+        )
+        for i, result in zip(indices, results):
+            outputs[i] = self._decode(tuple(result.hypotheses[0]))
+        return outputs
+
 
 class OpusMTTranslator:
     def __init__(self, config: OpusMTConfig):
@@ -67,10 +124,18 @@ class OpusMTTranslator:
         self.en_fr = _CT2Model(config.en_fr_path, en_fr_tokenizer, config)
         self.fr_en = _CT2Model(config.fr_en_path, fr_en_tokenizer, config)
 
-    def translate(self, text: str, src_lang: str) -> str:
+    def _model_for(self, src_lang: str) -> _CT2Model:
         if src_lang == self.config.lang1_label:
-            return self.en_fr.translate(text)
+            return self.en_fr
         if src_lang == self.config.lang2_label:
-            return self.fr_en.translate(text)
+            return self.fr_en
         logging.warning("Unknown source language %s; defaulting to %s", src_lang, self.config.lang1_label)
-        return self.en_fr.translate(text)
+        return self.en_fr
+
+    def translate(self, text: str, src_lang: str) -> str:
+        return self._model_for(src_lang).translate(text)
+
+    def translate_many(self, texts: List[str], src_lang: str) -> List[str]:
+        if not texts:
+            return []
+        return self._model_for(src_lang).translate_many(texts)
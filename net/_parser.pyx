@@ -0,0 +1,45 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+# net/_parser.pyx
+#
+# Compiled frame scanner for net.protocol.StreamParser.
+# Build in place with: cythonize -i net/_parser.pyx
+# StreamParser falls back to its pure-Python loop when this is not built.
+from cpython.bytes cimport PyBytes_FromStringAndSize
+
+cdef enum:
+    HDR_SIZE = 8
+    MAGIC = 0xAA
+    VERSION = 1
+
+
+def parse_frames(const unsigned char[:] buf, Py_ssize_t off, Py_ssize_t max_payload):
+    """
+    Scan complete frames in buf starting at off.
+    Returns (frames, off, resync): frames is a list of (msg_type, flags,
+    payload) tuples, off the new read offset, and resync is True when a bad
+    header was found at off.
+    """
+    cdef Py_ssize_t n = buf.shape[0]
+    cdef Py_ssize_t payload_len, end
+    frames = []
+
+    while n - off >= HDR_SIZE:
+        if buf[off] != MAGIC or buf[off + 1] != VERSION:
+            return frames, off, True
+
+        payload_len = ((<Py_ssize_t>buf[off + 4] << 24) | (<Py_ssize_t>buf[off + 5] << 16) |
+                       (<Py_ssize_t>buf[off + 6] << 8) | <Py_ssize_t>buf[off + 7])
+        end = off + HDR_SIZE + payload_len
+        if end > n:
+            break
+
+        # Oversized payloads are skipped once fully received.
+        if payload_len <= max_payload:
+            if payload_len:
+                payload = PyBytes_FromStringAndSize(<const char*>&buf[off + HDR_SIZE], payload_len)
+            else:
+                payload = b""
+            frames.append((buf[off + 2], buf[off + 3], payload))
+        off = end
+
+    return frames, off, False
@@ -4,11 +4,24 @@ import struct
 from dataclasses import dataclass
 from typing import List, Tuple
 
+try:
+    # Optional Cython scanner; build with `cythonize -i net/_parser.pyx`.
+    from net._parser import parse_frames as _parse_frames
+except ImportError:
+    _parse_frames = None
+
 HDR_FMT = "!BBBBI"
 HDR_SIZE = struct.calcsize(HDR_FMT)
+_HDR = struct.Struct(HDR_FMT)
+
+# Compact the parser buffer once this many consumed bytes accumulate.
+_COMPACT_BYTES = 65536
 
 MAGIC = 0xAA
 VERSION = 1
+MAGIC_VERSION = bytes([MAGIC, VERSION])
+# Header minus the constant magic/version bytes, which are checked directly.
+_HDR_BODY = struct.Struct("!xxBBI")
 
 MSG_TYPE_AUDIO = 1
 MSG_TYPE_TEXT  = 2
@@ -22,13 +35,22 @@ class Packet:
     payload: bytes
 
 def pack_header(msg_type: int, flags: int, payload_len: int) -> bytes:
-    return struct.pack(HDR_FMT, MAGIC, VERSION, msg_type, flags, payload_len)
+    return _HDR.pack(MAGIC, VERSION, msg_type, flags, payload_len)
 
 def build_packet(msg_type: int, flags: int, payload: bytes) -> bytes:
     if len(payload) > 0xFFFFFFFF:
         raise ValueError("payload too large for 32-bit len")
     return pack_header(msg_type, flags, len(payload)) + payload
 
+def build_packet_parts(msg_type: int, flags: int, payload: bytes) -> Tuple[bytes, bytes]:
+    """
+    Same framing as build_packet, but returns (header, payload) unjoined so
+    callers can hand both to a scatter-gather send without concatenating.
+    """
+    if len(payload) > 0xFFFFFFFF:
+        raise ValueError("payload too large for 32-bit len")
+    return _HDR.pack(MAGIC, VERSION, msg_type, flags, len(payload)), payload
+
 class StreamParser:
     """
     Incremental TCP stream parser for your msg_hdr_t framing.
@@ -36,37 +58,50 @@ class StreamParser:
     """
     def __init__(self, max_payload: int = MAX_PAYLOAD):
         self._buf = bytearray()
+        self._off = 0
         self._max_payload = max_payload
 
-    def feed(self, data: bytes) -> List[Packet]:
+    def feed(self, data: bytes | bytearray | memoryview) -> List[Packet]:
         self._buf.extend(data)
-        out: List[Packet] = []
+        if _parse_frames is not None:
+            frames, self._off, resync = _parse_frames(self._buf, self._off, self._max_payload)
+            out = [Packet(msg_type=m, flags=f, payload=p) for m, f, p in frames]
+            if resync:
+                # Resync strategy: clear buffer (your current behavior)
+                self._buf.clear()
+                self._off = 0
+        else:
+            out = self._scan()
 
-        while True:
-            if len(self._buf) < HDR_SIZE:
-                break
+        # Drop consumed bytes in one shift rather than once per packet.
+        if self._off and (self._off >= _COMPACT_BYTES or self._off > len(self._buf) // 2):
+            del self._buf[:self._off]
+            self._off = 0
 
-            magic, version, msg_type, flags, payload_len = struct.unpack(
-                HDR_FMT, self._buf[:HDR_SIZE]
-            )
+        return out
 
-            if magic != MAGIC or version != VERSION:
+    def _scan(self) -> List[Packet]:
+        out: List[Packet] = []
+        while len(self._buf) - self._off >= HDR_SIZE:
+            if not self._buf.startswith(MAGIC_VERSION, self._off):
                 # Resync strategy: clear buffer (your current behavior)
                 self._buf.clear()
+                self._off = 0
                 break
 
-            if payload_len > self._max_payload:
-                # Discard this oversized payload if fully received, otherwise wait.
-                if len(self._buf) < HDR_SIZE + payload_len:
-                    break
-                del self._buf[:HDR_SIZE + payload_len]
-                continue
+            msg_type, flags, payload_len = _HDR_BODY.unpack_from(self._buf, self._off)
 
-            if len(self._buf) < HDR_SIZE + payload_len:
+            end = self._off + HDR_SIZE + payload_len
+            if len(self._buf) < end:
                 break
 
-            payload = bytes(self._buf[HDR_SIZE:HDR_SIZE + payload_len])
-            del self._buf[:HDR_SIZE + payload_len]
-            out.append(Packet(msg_type=msg_type, flags=flags, payload=payload))
+            if payload_len > self._max_payload:
+                # Discard this oversized payload once fully received.
+                self._off = end
+                continue
 
-        return out
\ No newline at end of file
+            with memoryview(self._buf) as view:
+                payload = bytes(view[self._off + HDR_SIZE:end])
+            self._off = end
+            out.append(Packet(msg_type=msg_type, flags=flags, payload=payload))
+        return out
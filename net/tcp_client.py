@@ -3,7 +3,17 @@ from __future__ import annotations
 import logging
 import socket
 import select
-from typing import Optional, Tuple
+import time
+from typing import List, Optional, Sequence, Tuple, Union
+
+RECV_BUF_SIZE = 65536
+# Kernel socket buffers; large enough to absorb audio bursts on USB-Ethernet.
+SO_RCVBUF_BYTES = 1 << 20
+SO_SNDBUF_BYTES = 1 << 18
+# Stay well under the kernel's IOV_MAX for a single sendmsg call.
+SENDMSG_MAX_PARTS = 512
+# Upper bound on one send_many call, so a slow peer can't stall poll().
+SEND_TIMEOUT_S = 1.0
 
 class TCPServer:
     def __init__(self, host: str, port: int):
@@ -27,7 +37,25 @@ class TCPServer:
         self.conn: Optional[socket.socket] = None
         self.addr: Optional[Tuple[str, int]] = None
 
-    def poll(self, timeout_s: float = 0.01):
+        # Reused for every read; poll() hands out views into it.
+        self._rxbuf = bytearray(RECV_BUF_SIZE)
+        self._rxview = memoryview(self._rxbuf)
+
+    @staticmethod
+    def _tune_socket(conn: socket.socket) -> None:
+        try:
+            conn.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SO_RCVBUF_BYTES)
+            conn.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SO_SNDBUF_BYTES)
+        except OSError:
+            logging.warning("Could not resize socket buffers; using system defaults")
+        # Text frames are small and latency sensitive; don't let Nagle hold them.
+        conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def poll(self, timeout_s: float = 0.01) -> Union[bytes, memoryview]:
+        """
+        Wait up to timeout_s for a connection or data. Returned data is a view
+        into the shared receive buffer and is only valid until the next poll.
+        """
         rlist = [self.srv]
         if self.conn is not None:
             rlist.append(self.conn)
@@ -42,18 +70,20 @@ class TCPServer:
             self.conn = new_conn
             self.addr = addr
             self.conn.setblocking(False)
+            self._tune_socket(self.conn)
             logging.info("TCP client connected from %s:%s", addr[0], addr[1])
 
-        data = b""
+        data: Union[bytes, memoryview] = b""
         if self.conn is not None and self.conn in readable:
             try:
-                data = self.conn.recv(4096)
+                n = self.conn.recv_into(self._rxview)
             except BlockingIOError:
-                data = b""
+                n = 0
             except OSError:
-                data = b""
+                n = 0
+            data = self._rxview[:n]
 
-            if data == b"":
+            if n == 0:
                 # closed
                 try: self.conn.close()
                 except OSError: pass
@@ -71,3 +101,37 @@ class TCPServer:
             return True
         except OSError:
             return False
+
+    def send_many(self, parts: Sequence[bytes]) -> bool:
+        """
+        Send all parts back-to-back using scatter-gather sendmsg calls,
+        handling partial writes on the non-blocking socket. Gives up and
+        returns False once SEND_TIMEOUT_S has elapsed for the whole call.
+        """
+        if self.conn is None:
+            return False
+        pending: List[memoryview] = [memoryview(p) for p in parts if len(p)]
+        deadline = time.monotonic() + SEND_TIMEOUT_S
+        try:
+            while pending:
+                try:
+                    sent = self.conn.sendmsg(pending[:SENDMSG_MAX_PARTS])
+                except BlockingIOError:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    _, writable, _ = select.select([], [self.conn], [], remaining)
+                    if not writable:
+                        return False
+                    continue
+                while sent and pending:
+                    head = pending[0]
+                    if sent >= len(head):
+                        sent -= len(head)
+                        pending.pop(0)
+                    else:
+                        pending[0] = head[sent:]
+                        sent = 0
+            return True
+        except OSError:
+            return False
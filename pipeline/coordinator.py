@@ -7,12 +7,14 @@ import time
 from dataclasses import dataclass
 from typing import Optional
 
-import numpy as np
-
-from audio.format import decode_packed_24bit_stereo_to_mono
+from audio.format import (
+    decode_packed_24bit_stereo_to_mono,
+    decode_packed_24bit_stereo_to_mono_into,
+    decoded_sample_count,
+)
 from audio.ringbuffer import FloatRingBuffer
 from mt.opusmt_ct2 import OpusMTConfig, OpusMTTranslator
-from net.protocol import MSG_TYPE_AUDIO, MSG_TYPE_TEXT, StreamParser, build_packet
+from net.protocol import MSG_TYPE_AUDIO, MSG_TYPE_TEXT, StreamParser, build_packet_parts
 from net.tcp_client import TCPServer
 from s2t.commit import CommitConfig, SimpleCommitter
 from s2t.whisper_engine import WhisperConfig, WhisperEngine
@@ -46,7 +48,8 @@ class PipelineConfig:
 
 @dataclass
 class AudioChunk:
-    samples: np.ndarray
+    payload: bytes
+    channel: str
     lang: str
 
 
@@ -71,6 +74,11 @@ def _lang_to_channel(lang: str, lang1: str, lang2: str) -> str:
     return "left"
 
 
+def _is_meaningful(delta: str) -> bool:
+    # Whitespace/punctuation-only deltas aren't worth a translator call.
+    return any(ch.isalnum() for ch in delta)
+
+
 def _output_flag(lang: str, lang1: str, lang2: str) -> int:
     if lang == lang1:
         return FLAG_LANG1_OUT
@@ -93,6 +101,17 @@ class PipelineWorker(threading.Thread):
         self.current_lang = config.lang1_label
         self.rate = RateLimiter(config.step_hz)
         self.last_audio_ts = time.monotonic()
+        self._mt_q: queue.Queue[tuple[str, str]] = queue.Queue()
+        self._mt_thread = threading.Thread(target=self._mt_worker, daemon=True)
+
+    def _ingest(self, chunk: AudioChunk) -> None:
+        """Decode a packed PCM payload straight into the ring buffer."""
+        count = decoded_sample_count(len(chunk.payload), self.config.channels)
+        region = self.buffer.reserve(count)
+        written = decode_packed_24bit_stereo_to_mono_into(
+            chunk.payload, self.config.channels, chunk.channel, region
+        )
+        self.buffer.commit(written)
 
     def _transcribe_window(self) -> str:
         window_samples = int(self.config.window_seconds * self.config.sample_rate)
@@ -107,10 +126,48 @@ class PipelineWorker(threading.Thread):
         if not delta:
             return
         logging.debug("Commit delta lang=%s text=%r", src_lang, delta)
-        translated = self.translator.translate(delta, src_lang)
-        if translated:
-            logging.debug("Translated lang=%s text=%r", src_lang, translated)
-            self.tx_q.put((translated, src_lang))
+        if not _is_meaningful(delta):
+            logging.debug("Skipping non-lexical delta lang=%s text=%r", src_lang, delta)
+            return
+        self._mt_q.put((delta, src_lang))
+
+    def _mt_worker(self) -> None:
+        """
+        Translation stage. Runs on its own thread so Whisper can start on the
+        next window while OpusMT works; deltas that queued up meanwhile are
+        translated as one batch per source language.
+        """
+        logging.info("Translation worker started")
+        while not self.stop.is_set():
+            try:
+                first = self._mt_q.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            items = [first]
+            while True:
+                try:
+                    items.append(self._mt_q.get_nowait())
+                except queue.Empty:
+                    break
+
+            # Batch contiguous runs per language so output order is preserved.
+            start = 0
+            while start < len(items):
+                src_lang = items[start][1]
+                end = start
+                while end < len(items) and items[end][1] == src_lang:
+                    end += 1
+                deltas = [delta for delta, _lang in items[start:end]]
+                try:
+                    translations = self.translator.translate_many(deltas, src_lang)
+                except Exception:
+                    logging.exception("Translation failed; dropping %d deltas", len(deltas))
+                    translations = []
+                for translated in translations:
+                    if translated:
+                        logging.debug("Translated lang=%s text=%r", src_lang, translated)
+                        self.tx_q.put((translated, src_lang))
+                start = end
 
     def _flush(self) -> None:
         if self.buffer.size == 0:
@@ -123,6 +180,7 @@ class PipelineWorker(threading.Thread):
 
     def run(self) -> None:
         logging.info("Pipeline worker started")
+        self._mt_thread.start()
         while not self.stop.is_set():
             try:
                 chunk: AudioChunk = self.audio_q.get(timeout=0.1)
@@ -138,7 +196,7 @@ class PipelineWorker(threading.Thread):
                 self._flush()
                 self.current_lang = chunk.lang
 
-            self.buffer.append(chunk.samples)
+            self._ingest(chunk)
             enough = self.buffer.size >= int(self.config.min_window_seconds * self.config.sample_rate)
             if enough and self.rate.allow():
                 text = self._transcribe_window()
@@ -214,30 +272,33 @@ class Coordinator:
                 continue
 
             channel = _lang_to_channel(self.current_lang, self.config.lang1_label, self.config.lang2_label)
-            samples = decode_packed_24bit_stereo_to_mono(
-                payload, channels=self.config.channels, channel_select=channel
-            )
-            if samples.size == 0:
-                continue
-
             if self.plotter is not None:
-                try:
-                    self.plotter.push_samples(samples, self.config.sample_rate)
-                except Exception:
-                    logging.exception("Plotter failed; disabling waveform display")
-                    self.plotter = None
-
+                self._plot(payload, channel)
             try:
-                self.audio_q.put_nowait(AudioChunk(samples=samples, lang=self.current_lang))
+                self.audio_q.put_nowait(AudioChunk(payload=payload, channel=channel, lang=self.current_lang))
             except queue.Full:
                 logging.warning("Audio queue full; dropping audio chunk")
 
+    def _plot(self, payload: bytes, channel: str) -> None:
+        # Fed on arrival rather than from the worker, so the display keeps
+        # real time while Whisper runs and still shows chunks dropped below.
+        try:
+            samples = decode_packed_24bit_stereo_to_mono(
+                payload, channels=self.config.channels, channel_select=channel
+            )
+            if samples.size:
+                self.plotter.push_samples(samples, self.config.sample_rate)
+        except Exception:
+            logging.exception("Plotter failed; disabling waveform display")
+            self.plotter = None
+
     def _drain_tx(self) -> None:
+        parts: list[bytes] = []
         while True:
             try:
                 text, src_lang = self.tx_q.get_nowait()
             except queue.Empty:
-                return
+                break
             out_lang = self.config.lang2_label if src_lang == self.config.lang1_label else self.config.lang1_label
             flags = _output_flag(out_lang, self.config.lang1_label, self.config.lang2_label)
             raw = text.encode("utf-8")
@@ -250,7 +311,7 @@ class Coordinator:
                     out_lang,
                     chunk.decode("utf-8", errors="replace"),
                 )
-                packet = build_packet(MSG_TYPE_TEXT, flags, chunk)
-                if not self.server.send(packet):
-                    logging.warning("No active connection; drop text")
-                    return
+                parts.extend(build_packet_parts(MSG_TYPE_TEXT, flags, chunk))
+
+        if parts and not self.server.send_many(parts):
+            logging.warning("No active connection; drop text")
@@ -2,29 +2,56 @@ from __future__ import annotations
 
 from collections import deque
 from dataclasses import dataclass
-from typing import Deque
+from os.path import commonprefix
+from typing import Deque, List
 
 
 def _lcp_all(items: Deque[str]) -> str:
-    if not items:
-        return ""
-    shortest = min(items, key=len)
-    for i, ch in enumerate(shortest):
-        for s in items:
-            if s[i] != ch:
-                return shortest[:i]
-    return shortest
+    # commonprefix compares only the lexicographic min and max, which share
+    # the prefix common to every item; no per-item character loop.
+    return commonprefix(list(items))
+
+
+def _lcp_pair(a: str, b: str) -> str:
+    return commonprefix([a, b])
 
 
-def _overlap_suffix_prefix(left: str, right: str) -> int:
+def _failure(pattern: str) -> List[int]:
+    """
+    Morris-Pratt failure function: fail[i] is the length of the longest
+    proper prefix of pattern[:i + 1] that is also its suffix.
+    """
+    fail = [0] * len(pattern)
+    k = 0
+    for i in range(1, len(pattern)):
+        while k and pattern[i] != pattern[k]:
+            k = fail[k - 1]
+        if pattern[i] == pattern[k]:
+            k += 1
+        fail[i] = k
+    return fail
+
+
+def _overlap_suffix_prefix(left: str, right: str, left_fail: List[int] | None = None) -> int:
     """
     Return the longest suffix length of left that is a prefix of right.
+
+    Runs in O(len(left) + len(right)) by matching reversed right against
+    the reversed left; left_fail may be a cached _failure(left[::-1]).
     """
-    max_len = min(len(left), len(right))
-    for size in range(max_len, 0, -1):
-        if left[-size:] == right[:size]:
-            return size
-    return 0
+    if not left or not right:
+        return 0
+    pattern = left[::-1]
+    fail = left_fail if left_fail is not None else _failure(pattern)
+    q = 0
+    for ch in reversed(right):
+        if q == len(pattern):
+            q = fail[q - 1]
+        while q and ch != pattern[q]:
+            q = fail[q - 1]
+        if ch == pattern[q]:
+            q += 1
+    return q
 
 
 @dataclass
@@ -44,10 +71,50 @@ class SimpleCommitter:
         self.config = config or CommitConfig()
         self._history: Deque[str] = deque(maxlen=self.config.history_len)
         self._committed = ""
+        self._stable = ""
+        self._fail_key = ""
+        self._fail: List[int] = []
 
     def reset(self) -> None:
         self._history.clear()
         self._committed = ""
+        self._stable = ""
+        self._fail_key = ""
+        self._fail = []
+
+    def _push(self, text: str) -> None:
+        """
+        Append to the history while keeping self._stable equal to the LCP of
+        every entry, updating it incrementally instead of rescanning.
+        """
+        if not self._history:
+            self._history.append(text)
+            # With history_len=0 the deque (maxlen=0) stays empty, so nothing
+            # is ever stable.
+            self._stable = text if self._history else ""
+            return
+
+        if len(self._history) == self._history.maxlen:
+            self._history.popleft()
+            # Dropping an entry can only lengthen the LCP, and only if the
+            # survivors all agree on the character just past it.
+            cut = len(self._stable)
+            if self._history and all(len(s) > cut for s in self._history) and \
+                    len({s[cut] for s in self._history}) == 1:
+                self._stable = _lcp_all(self._history)
+            elif not self._history:
+                self._stable = text
+
+        self._history.append(text)
+        self._stable = _lcp_pair(self._stable, text)
+
+    def _overlap(self, text: str) -> int:
+        # The committed prefix rarely changes between feeds, so reuse its
+        # failure table instead of rebuilding it on every mismatch.
+        if self._fail_key != self._committed:
+            self._fail_key = self._committed
+            self._fail = _failure(self._committed[::-1])
+        return _overlap_suffix_prefix(self._committed, text, self._fail)
 
     @property
     def committed(self) -> str:
@@ -58,13 +125,13 @@ class SimpleCommitter:
         if not text:
             return ""
         if self._committed and not text.startswith(self._committed):
-            overlap = _overlap_suffix_prefix(self._committed, text)
+            overlap = self._overlap(text)
             if overlap >= self.config.min_overlap_chars:
                 self._committed = self._committed[-overlap:] if overlap else ""
             self._history.clear()
-        self._history.append(text)
+        self._push(text)
 
-        stable = _lcp_all(self._history)
+        stable = self._stable
         if len(stable) <= len(self._committed):
             return ""
         if len(stable) - len(self._committed) < self.config.min_commit_chars:
@@ -83,7 +150,7 @@ class SimpleCommitter:
             self._committed = text
             return delta
         if self._committed:
-            overlap = _overlap_suffix_prefix(self._committed, text)
+            overlap = self._overlap(text)
             if overlap:
                 delta = text[overlap:]
                 self._committed = text
@@ -1,12 +1,34 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass
+import hashlib
 import logging
-from typing import Optional
+import threading
+from typing import Dict, Optional, Tuple
 
 import numpy as np
 from faster_whisper import WhisperModel
 
+# faster-whisper expects 16 kHz mono float32 input.
+WHISPER_SAMPLE_RATE = 16000
+
+# Loaded models shared across engines, keyed on (model_size, device, compute_type).
+_MODELS: Dict[Tuple[str, str, str], WhisperModel] = {}
+_MODELS_LOCK = threading.Lock()
+
+
+def _load_model(model_size: str, device: str, compute_type: str) -> WhisperModel:
+    key = (model_size, device, compute_type)
+    with _MODELS_LOCK:
+        model = _MODELS.get(key)
+        if model is None:
+            model = WhisperModel(model_size, device=device, compute_type=compute_type)
+            _MODELS[key] = model
+        else:
+            logging.info("Reusing loaded Whisper model size=%s device=%s", model_size, device)
+        return model
+
 
 @dataclass
 class WhisperConfig:
@@ -16,6 +38,10 @@ class WhisperConfig:
     language: Optional[str] = None
     beam_size: int = 1
     no_speech_threshold: float = 0.9
+    # Windows quieter than this RMS skip the model entirely (0 disables).
+    silence_rms: float = 0.005
+    transcript_cache_size: int = 128
+    transcript_cache_max_seconds: float = 2.0
 
 
 class WhisperEngine:
@@ -28,11 +54,14 @@ class WhisperEngine:
             self.config.compute_type,
             self.config.language,
         )
-        self.model = WhisperModel(
+        self.model = _load_model(
             self.config.model_size,
-            device=self.config.device,
-            compute_type=self.config.compute_type,
+            self.config.device,
+            self.config.compute_type,
         )
+        # LRU of recent short-chunk transcripts keyed on (language, content hash, size).
+        self._cache: "OrderedDict[Tuple[str, bytes, int], str]" = OrderedDict()
+        self._cache_max_samples = int(self.config.transcript_cache_max_seconds * WHISPER_SAMPLE_RATE)
 
     def transcribe(self, audio: np.ndarray, language: Optional[str] = None) -> str:
         if audio.size == 0:
@@ -40,6 +69,22 @@ class WhisperEngine:
         lang = self.config.language if language is None else language
         if not lang:
             raise ValueError("Whisper language must be provided to avoid detection.")
+
+        if self.config.silence_rms > 0.0:
+            # dot() gives the sum of squares in one pass without a temporary.
+            rms = float(np.sqrt(float(np.dot(audio, audio)) / audio.size))
+            if rms < self.config.silence_rms:
+                return ""
+
+        key = None
+        if self.config.transcript_cache_size > 0 and audio.size <= self._cache_max_samples:
+            digest = hashlib.blake2b(np.ascontiguousarray(audio), digest_size=16).digest()
+            key = (lang, digest, int(audio.size))
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
+
         segments, _info = self.model.transcribe(
             audio,
             language=lang,
@@ -47,6 +92,13 @@ class WhisperEngine:
             no_speech_threshold=self.config.no_speech_threshold,
             vad_filter=False,
             condition_on_previous_text=False,
+            word_timestamps=False,
         )
         parts = [seg.text for seg in segments]
-        return "".join(parts).strip()
+        text = "".join(parts).strip()
+
+        if key is not None:
+            self._cache[key] = text
+            if len(self._cache) > self.config.transcript_cache_size:
+                self._cache.popitem(last=False)
+        return text
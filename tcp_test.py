@@ -15,7 +15,15 @@ try:
 except ImportError as exc:
     raise SystemExit("matplotlib is required for waveform display: pip install matplotlib") from exc
 
-import select
+import selectors
+
+try:
+    from numba import njit
+except ImportError:  # Optional; decode_audio_payload (NumPy) is used instead.
+    njit = None
+
+from audio.ringbuffer import FloatRingBuffer
+from utils.timing_helpers import RateLimiter
 
 HOST = "192.168.0.165"
 PORT = 3333
@@ -23,6 +31,7 @@ PORT = 3333
 # ESP32 msg_hdr_t: magic(1), version(1), msg_type(1), flags(1), payload_len(4)
 HDR_FMT = "!BBBBI"
 HDR_SIZE = struct.calcsize(HDR_FMT)
+HDR_STRUCT = struct.Struct(HDR_FMT)  # compiled once; unpack_from reads in place
 MAGIC = 0xAA
 VERSION = 1
 MSG_TYPE_AUDIO = 1
@@ -38,45 +47,102 @@ CHANNEL_SELECT = "left"  # left, right, or mix
 SAMPLE_BYTES = 3  # packed 24-bit samples (little-endian)
 FRAME_BYTES = SAMPLE_BYTES * CHANNELS
 VIEW_SECONDS = 2.0
+DRAW_HZ = 30.0
 MAX_BUFFER_SECONDS = 30.0
 MAX_PAYLOAD = 4096
+RX_CAPACITY = 64 * 1024
 TEXT_MAX_PAYLOAD = 128  # Matches TEXT_BUF_SIZE in ESP32-LLL/main/app_tcp.h
 TEXT_FLAGS = FLAG_SCREEN1
 
 INPUT_LANGUAGE = "unknown"
 
+# Channel pick over (n, CHANNELS) int32 frames, resolved once at import
+# instead of branching on CHANNEL_SELECT per packet. Unknown values -> left.
+_CHANNEL_SELECTORS = {
+    "left": lambda frames: frames[:, 0],
+    "right": lambda frames: frames[:, 1],
+    "mix": lambda frames: frames.mean(axis=1),
+}
+_select_fn = _CHANNEL_SELECTORS.get(CHANNEL_SELECT, _CHANNEL_SELECTORS["left"])
+
 # Decode packed 24-bit little-endian audio samples to float32 numpy array.
-def decode_audio_payload(payload: bytes) -> np.ndarray:
+# Accepts any bytes-like object (bytes, bytearray, memoryview) without copying.
+def decode_audio_payload(payload) -> np.ndarray:
     if len(payload) < SAMPLE_BYTES:
         return np.empty((0,), dtype=np.float32)
     trim_len = len(payload) - (len(payload) % SAMPLE_BYTES)
-    if trim_len != len(payload):
-        payload = payload[:trim_len]
 
-    data = np.frombuffer(payload, dtype=np.uint8).reshape(-1, SAMPLE_BYTES)
-    if data.size == 0:
+    # count= truncates to whole samples without slicing (and copying) payload.
+    data = np.frombuffer(payload, dtype=np.uint8, count=trim_len).reshape(-1, SAMPLE_BYTES)
+    n = data.shape[0]
+    if n == 0:
         return np.empty((0,), dtype=np.float32)
 
-    vals = (data[:, 0].astype(np.int32) |
-            (data[:, 1].astype(np.int32) << 8) |
-            (data[:, 2].astype(np.int32) << 16))
-    neg = (vals & 0x800000) != 0
-    vals[neg] -= 1 << 24
+    # Pad each sample to 4 bytes (low byte zero) and arithmetic-shift right
+    # by 8: one pass, and sign extension comes for free.
+    buf = np.zeros((n, 4), dtype=np.uint8)
+    buf[:, 1:4] = data
+    vals = buf.reshape(-1).view("<i4") >> 8
 
     if CHANNELS > 1:
         trim = vals.size - (vals.size % CHANNELS)
-        frames = vals[:trim].reshape(-1, CHANNELS)
-        if CHANNEL_SELECT == "right":
-            mono = frames[:, 1]
-        elif CHANNEL_SELECT == "mix":
-            mono = frames.mean(axis=1)
-        else:
-            mono = frames[:, 0]
+        mono = _select_fn(vals[:trim].reshape(-1, CHANNELS))
     else:
         mono = vals
 
-    # Normalize to [-1.0, 1.0] from 24-bit signed range.
-    return mono.astype(np.float32) / float(1 << 23)
+    # Normalize to [-1.0, 1.0] from 24-bit signed range (fused cast + scale).
+    return np.multiply(mono, np.float32(1.0 / (1 << 23)), dtype=np.float32)
+
+if njit is not None:
+    # Fused unpack + sign-extend + channel pick + scale, writing in place.
+    @njit(cache=True, nogil=True)
+    def _decode_i24_le_into(buf, out, channels, chan_idx):
+        stride = SAMPLE_BYTES * channels
+        for i in range(out.size):
+            j = i * stride + chan_idx * SAMPLE_BYTES
+            s = np.int32(buf[j]) | (np.int32(buf[j + 1]) << 8) | (np.int32(buf[j + 2]) << 16)
+            s = (s ^ 0x800000) - 0x800000
+            out[i] = s * (1.0 / 8388608.0)
+
+    # Same, averaging every channel of the frame ("mix"). chan_idx is unused;
+    # it keeps the call signature identical to _decode_i24_le_into.
+    @njit(cache=True, nogil=True)
+    def _decode_i24_le_mix_into(buf, out, channels, chan_idx):
+        stride = SAMPLE_BYTES * channels
+        scale = 1.0 / (8388608.0 * channels)
+        for i in range(out.size):
+            acc = 0
+            for c in range(channels):
+                j = i * stride + c * SAMPLE_BYTES
+                s = np.int32(buf[j]) | (np.int32(buf[j + 1]) << 8) | (np.int32(buf[j + 2]) << 16)
+                acc += (s ^ 0x800000) - 0x800000
+            out[i] = acc * scale
+
+    # Kernel and channel index picked once, like _select_fn.
+    if CHANNEL_SELECT == "mix":
+        _decode_kernel = _decode_i24_le_mix_into
+    else:
+        _decode_kernel = _decode_i24_le_into
+    _KERNEL_CHAN_IDX = 1 if (CHANNEL_SELECT == "right" and CHANNELS > 1) else 0
+else:
+    _decode_kernel = None
+
+
+# Decode a payload straight into the ring's storage; returns samples written.
+def decode_audio_into(payload, ring: FloatRingBuffer) -> int:
+    if _decode_kernel is None:
+        samples = decode_audio_payload(payload)
+        ring.append(samples)
+        return samples.size
+
+    n = len(payload) // FRAME_BYTES
+    if n == 0:
+        return 0
+    region = ring.reserve(n)
+    raw = np.frombuffer(payload, dtype=np.uint8, count=n * FRAME_BYTES)
+    _decode_kernel(raw, region, CHANNELS, _KERNEL_CHAN_IDX)
+    ring.commit(n)
+    return n
 
 #takes flags from header and returns language string
 def update_language(flags: int) -> str:
@@ -97,15 +163,24 @@ def run_server() -> None:
 
     window_len = int(SAMPLE_RATE * VIEW_SECONDS)
     max_len = int(SAMPLE_RATE * MAX_BUFFER_SECONDS)
-    audio_stream = np.empty((0,), dtype=np.float32)
+    audio_stream = FloatRingBuffer(max_len)
+    window_buf = np.zeros(window_len, dtype=np.float32)
+    draw_rl = RateLimiter(DRAW_HZ)
+    dirty = False
     carry = b""
-    buffer = bytearray()
+    # Fixed receive ring: bytes live in rx_buf[head:tail]; frames are parsed
+    # in place and the residue is only shifted down when space runs out.
+    rx_buf = bytearray(RX_CAPACITY)
+    rx_view = memoryview(rx_buf)
+    head = tail = 0
+    skip = 0
     conn = None
 
     plt.ion()
     fig, ax = plt.subplots()
     fig.subplots_adjust(bottom=0.18)
-    line, = ax.plot(np.zeros(window_len, dtype=np.float32))
+    # Animated: excluded from full redraws and blitted on its own.
+    line, = ax.plot(np.zeros(window_len, dtype=np.float32), animated=True)
     ax.set_ylim(-1.0, 1.0)
     ax.set_xlim(0, window_len)
     ax.set_title("Waiting for audio...")
@@ -117,10 +192,34 @@ def run_server() -> None:
     btn_ax = fig.add_axes([0.70, 0.06, 0.12, 0.06])
     send_btn = Button(btn_ax, "Send")
 
+    # Blitting: keep a snapshot of the static axes and only repaint the line.
+    # Any full redraw (resize, title/status change) re-captures it.
+    bg = None
+    shown_lang = None
+
+    def on_draw(_evt) -> None:
+        nonlocal bg
+        bg = fig.canvas.copy_from_bbox(ax.bbox)
+        ax.draw_artist(line)
+
+    fig.canvas.mpl_connect("draw_event", on_draw)
+    fig.canvas.draw()
+
+    # Build the display window from the ring only when drawing, reusing one
+    # zero-padded buffer instead of concatenating a fresh pad each packet.
+    def window_view() -> np.ndarray:
+        recent = audio_stream.get_last(window_len)
+        start = window_len - recent.size
+        window_buf[:start] = 0.0
+        window_buf[start:] = recent
+        return window_buf
+
     def update_count(text: str) -> None:
         count_text.set_text(f"Chars: {len(text)}")
         fig.canvas.draw_idle()
 
+    hdr_buf = bytearray(HDR_SIZE)  # reused text header, packed in place
+
     def send_text_payload(text: str) -> None:
         nonlocal conn
         if not text:
@@ -128,14 +227,20 @@ def run_server() -> None:
         if conn is None:
             print("No ESP32 connection; text not sent.")
             return
-        data = text.encode("utf-8")
+        data = memoryview(text.encode("utf-8"))
         offset = 0
         while offset < len(data):
             chunk = data[offset:offset + TEXT_MAX_PAYLOAD]
-            header = struct.pack(HDR_FMT, MAGIC, VERSION, MSG_TYPE_TEXT,
+            HDR_STRUCT.pack_into(hdr_buf, 0, MAGIC, VERSION, MSG_TYPE_TEXT,
                                  TEXT_FLAGS, len(chunk))
             try:
-                conn.sendall(header + chunk)
+                # Gather header + payload into one segment without concatenating.
+                sent = conn.sendmsg([hdr_buf, chunk])
+                if sent < HDR_SIZE:
+                    conn.sendall(hdr_buf[sent:])
+                    sent = HDR_SIZE
+                if sent < HDR_SIZE + len(chunk):
+                    conn.sendall(chunk[sent - HDR_SIZE:])
             except OSError as exc:
                 print(f"Failed to send text: {exc}")
                 return
@@ -151,71 +256,89 @@ def run_server() -> None:
     text_box.on_submit(submit_text)
     send_btn.on_clicked(lambda _evt: submit_text())
 
-    #select used here for a non-blocking event loop using select
-    #waits 50 ms to see whether server socket or active connection socket ready.
-    #args read_list, write_list, except_list, timeout
-    #posix io multiplexing style
+    #selector (epoll on Linux) used for a non-blocking event loop
+    #sockets are registered once; select(timeout=0) only polls them, the
+    #plt.pause below is what paces the loop and services the GUI.
+    #key.data tells the listening socket ("srv") from the connection ("conn")
+    sel = selectors.DefaultSelector()
+    sel.register(srv, selectors.EVENT_READ, data="srv")
     print(f"Listening on {HOST}:{PORT} ...")
     while True:
-        readable, _, _ = select.select([srv] + ([conn] if conn is not None else []), [], [], 0.01)
-        if srv in readable:
+        ready = {key.data for key, _ in sel.select(timeout=0)}
+        if "srv" in ready:
             new_conn, addr = srv.accept()
             if conn is not None:
+                sel.unregister(conn)
                 conn.close()
             conn = new_conn
             conn_addr = addr
             conn.setblocking(False)
-            buffer.clear()
+            # Text packets are small; don't let Nagle hold them back.
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sel.register(conn, selectors.EVENT_READ, data="conn")
+            ready.discard("conn")  # readiness was for the replaced socket
+            head = tail = skip = 0
             carry = b""
             status_text.set_text(f"Connected: {addr[0]}:{addr[1]}")
             fig.canvas.draw_idle()
             print(f"Connected by {addr}")
 
-        if conn is not None and conn in readable:
+        if conn is not None and "conn" in ready:
+            if head == tail:
+                head = tail = 0
+            elif RX_CAPACITY - tail < HDR_SIZE + MAX_PAYLOAD:
+                rx_buf[:tail - head] = rx_buf[head:tail]
+                tail -= head
+                head = 0
             try:
-                data = conn.recv(4096)
+                got = conn.recv_into(rx_view[tail:])
             except BlockingIOError:
-                data = b""
+                got = 0
             except OSError as exc:
                 print(f"Socket error: {exc}")
-                data = b""
+                got = 0
 
             #checks for availability of data 
             #if data is empty, connection is closed
             #if data present, check practical bounds and process
             #srv active listening socket, conn active connection socket
-            if not data:
+            if not got:
                 print("Connection closed")
+                sel.unregister(conn)
                 conn.close()
                 conn = None
                 conn_addr = None
                 status_text.set_text("Disconnected")
                 fig.canvas.draw_idle()
             else:
-                buffer.extend(data)
+                tail += got
                 while True:
-                    if len(buffer) < HDR_SIZE:
+                    if skip:
+                        # Still discarding an oversized payload.
+                        drop = min(skip, tail - head)
+                        head += drop
+                        skip -= drop
+                        if skip:
+                            break
+                    if tail - head < HDR_SIZE:
                         break
-                    magic, version, msg_type, flags, payload_len = struct.unpack(
-                        HDR_FMT, buffer[:HDR_SIZE]
-                    )
+                    magic, version, msg_type, flags, payload_len = HDR_STRUCT.unpack_from(rx_buf, head)
                     if magic != MAGIC or version != VERSION:
                         print(f"Bad header: magic={magic} version={version}")
-                        buffer.clear()
+                        head = tail = 0
                         break
                     if payload_len > MAX_PAYLOAD:
-                        if len(buffer) < HDR_SIZE + payload_len:
-                            break
                         print(f"Payload too large ({payload_len}), discarding")
-                        del buffer[:HDR_SIZE + payload_len]
+                        skip = HDR_SIZE + payload_len
                         continue
-                    if len(buffer) < HDR_SIZE + payload_len:
+                    if tail - head < HDR_SIZE + payload_len:
                         break
-                    
+
                     ## start processing packet to draw waveform
 
-                    payload = bytes(buffer[HDR_SIZE:HDR_SIZE + payload_len])
-                    del buffer[:HDR_SIZE + payload_len]
+                    # Zero-copy view; only valid until rx_buf is compacted.
+                    payload = rx_view[head + HDR_SIZE:head + HDR_SIZE + payload_len]
+                    head += HDR_SIZE + payload_len
 
                     if msg_type != MSG_TYPE_AUDIO:
                         continue
@@ -225,26 +348,28 @@ def run_server() -> None:
                         INPUT_LANGUAGE = new_lang
 
                     if FRAME_BYTES > 0:
-                        payload = carry + payload
+                        if carry:
+                            payload = b"".join((carry, payload))
                         trim_len = len(payload) - (len(payload) % FRAME_BYTES)
-                        carry = payload[trim_len:]
+                        carry = bytes(payload[trim_len:])
                         payload = payload[:trim_len]
 
-                    samples = decode_audio_payload(payload)
-                    if samples.size == 0:
+                    if decode_audio_into(payload, audio_stream) == 0:
                         continue
-
-                    audio_stream = np.concatenate((audio_stream, samples))
-                    if audio_stream.size > max_len:
-                        audio_stream = audio_stream[-max_len:]
-                    window = audio_stream[-window_len:]
-                    if window.size < window_len:
-                        pad = np.zeros(window_len - window.size, dtype=np.float32)
-                        window = np.concatenate((pad, window))
-
-                    line.set_ydata(window)
-                    ax.set_title(f"Live Audio ({INPUT_LANGUAGE})")
-                    fig.canvas.draw_idle()
+                    dirty = True
+
+        # Redraw at most DRAW_HZ, coalescing however many packets arrived.
+        if dirty and draw_rl.allow():
+            line.set_ydata(window_view())
+            if INPUT_LANGUAGE != shown_lang:
+                shown_lang = INPUT_LANGUAGE
+                ax.set_title(f"Live Audio ({INPUT_LANGUAGE})")
+                fig.canvas.draw_idle()
+            elif bg is not None:
+                fig.canvas.restore_region(bg)
+                ax.draw_artist(line)
+                fig.canvas.blit(ax.bbox)
+            dirty = False
 
         plt.pause(0.001)
 
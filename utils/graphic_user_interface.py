@@ -1,11 +1,9 @@
 from __future__ import annotations
 
 import time
-import threading
 import tkinter as tk
-from collections import deque
 from dataclasses import dataclass
-from typing import Callable, Deque, Tuple
+from typing import Callable, List, Tuple
 
 import numpy as np
 
@@ -25,42 +23,68 @@ class AudioIntensityPlotter:
     def __init__(self, window_seconds: float = 10.0, target_hz: float = 20.0):
         self._cfg = _SampleWindow(window_seconds=window_seconds, target_hz=target_hz)
         self._period = 1.0 / max(target_hz, 1e-6)
-        self._samples: Deque[Tuple[float, float]] = deque()
-        self._lock = threading.Lock()
+        # History as parallel (SoA) ring buffers: emit times and levels.
+        # Timestamps stay float64; monotonic seconds lose precision in float32.
+        # Single producer (audio thread) / single consumer (Tk thread): only
+        # the producer writes slots and publishes _count/_head afterwards, and
+        # _redraw snapshots both once, so no lock is needed on the push path.
+        self._cap = max(2, int(target_hz * window_seconds * 2))
+        self._ts = np.zeros(self._cap, dtype=np.float64)
+        self._lv = np.zeros(self._cap, dtype=np.float32)
+        self._head = 0
+        self._count = 0
+        # Interleaved x/y canvas coordinates, reused every redraw.
+        self._points = np.empty(self._cap * 2, dtype=np.float64)
         self._accum_sum = 0.0
         self._accum_count = 0
         self._last_emit = 0.0
         self._root: tk.Tk | None = None
         self._canvas: tk.Canvas | None = None
         self._on_close: Callable[[], None] | None = None
+        # Reused |x| buffer so push_samples doesn't allocate per packet.
+        self._scratch = np.empty(8192, dtype=np.float32)
 
     def push_samples(self, samples: np.ndarray, sample_rate: int) -> None:
         if samples.size == 0:
             return
-        level = float(np.mean(np.abs(samples)))
+        n = samples.size
+        if n > self._scratch.size:
+            self._scratch = np.empty(n, dtype=np.float32)
+        mag = self._scratch[:n]
+        np.abs(samples, out=mag)
+        level = float(mag.mean())
         level = max(0.0, min(1.0, level))
         self._push_level(level, time.monotonic())
 
     def _push_level(self, level: float, ts: float) -> None:
-        with self._lock:
-            self._accum_sum += level
-            self._accum_count += 1
+        self._accum_sum += level
+        self._accum_count += 1
 
-            if self._last_emit == 0.0:
-                self._last_emit = ts
-
-            if (ts - self._last_emit) < self._period:
-                return
-
-            avg = self._accum_sum / max(self._accum_count, 1)
-            self._accum_sum = 0.0
-            self._accum_count = 0
+        if self._last_emit == 0.0:
             self._last_emit = ts
-            self._samples.append((ts, avg))
 
-            cutoff = ts - self._cfg.window_seconds
-            while self._samples and self._samples[0][0] < cutoff:
-                self._samples.popleft()
+        if (ts - self._last_emit) < self._period:
+            return
+
+        avg = self._accum_sum / max(self._accum_count, 1)
+        self._accum_sum = 0.0
+        self._accum_count = 0
+        self._last_emit = ts
+        head = self._head
+        self._ts[head] = ts
+        self._lv[head] = avg
+        self._count = min(self._count + 1, self._cap)
+        self._head = (head + 1) % self._cap
+
+    def _segments(self) -> List[Tuple[int, int]]:
+        """Ring index ranges oldest-first; timestamps ascend within each."""
+        count = self._count
+        head = self._head
+        if count < self._cap:
+            return [(0, head)]
+        # Skip the slot at head: it is the next one the producer overwrites.
+        # The ring holds twice the window, so the oldest entry is never shown.
+        return [(head + 1, self._cap), (0, head)]
 
     def run(self, on_close: Callable[[], None] | None = None) -> None:
         self._on_close = on_close
@@ -95,21 +119,25 @@ class AudioIntensityPlotter:
         self._canvas.delete("waveform")
         now = time.monotonic()
         cutoff = now - self._cfg.window_seconds
-        with self._lock:
-            while self._samples and self._samples[0][0] < cutoff:
-                self._samples.popleft()
-            samples = list(self._samples)
-
-        if not samples:
+        x_scale = width / self._cfg.window_seconds
+        n = 0
+        # Write straight from the ring views into the interleaved points
+        # buffer; no per-draw copies of the history.
+        for start, stop in self._segments():
+            ts = self._ts[start:stop]
+            first = int(np.searchsorted(ts, cutoff))
+            ts = ts[first:]
+            lv = self._lv[start + first:stop]
+            k = ts.size
+            xs = self._points[2 * n:2 * (n + k):2]
+            ys = self._points[2 * n + 1:2 * (n + k):2]
+            np.subtract(ts, cutoff, out=xs)
+            np.multiply(xs, x_scale, out=xs)
+            np.clip(xs, 0.0, width, out=xs)
+            np.multiply(lv, -height, out=ys)
+            np.add(ys, height, out=ys)
+            n += k
+
+        if n < 2:
             return
-
-        points = []
-        for ts, level in samples:
-            x = (ts - cutoff) / self._cfg.window_seconds
-            x = max(0.0, min(1.0, x))
-            px = x * width
-            py = height - (level * height)
-            points.extend((px, py))
-
-        if len(points) >= 4:
-            self._canvas.create_line(*points, fill="#4de26c", width=2, tags="waveform")
+        self._canvas.create_line(*self._points[:2 * n].tolist(), fill="#4de26c", width=2, tags="waveform")
@@ -3,12 +3,27 @@ import time
 
 class RateLimiter:
     def __init__(self, hz: float):
-        self.period = 1.0 / max(hz, 1e-6)
-        self.t_next = 0.0
+        # Integer monotonic nanoseconds: cheap to read and immune to wall-clock jumps.
+        self.period_ns = max(1, int(1e9 / max(hz, 1e-6)))
+        self.t_next_ns = 0
 
     def allow(self) -> bool:
-        now = time.time()
-        if now >= self.t_next:
-            self.t_next = now + self.period
-            return True
-        return False
\ No newline at end of file
+        now = time.monotonic_ns()
+        ok = now >= self.t_next_ns
+        if ok:
+            self.t_next_ns = now + self.period_ns
+        return ok
+
+    def allow_drop_backlog(self) -> bool:
+        """
+        Fixed-cadence variant of allow(): ticks stay on the original schedule,
+        but after a stall it resumes from now instead of bursting to catch up.
+        """
+        now = time.monotonic_ns()
+        ok = now >= self.t_next_ns
+        if ok:
+            self.t_next_ns += self.period_ns
+            if self.t_next_ns <= now:
+                # Missed at least one whole tick: skip it rather than firing twice.
+                self.t_next_ns = now + self.period_ns
+        return ok
\ No newline at end of file